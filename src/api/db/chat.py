@@ -21,27 +21,31 @@ async def store_messages(
     async with get_new_db_connection() as conn:
         cursor = await conn.cursor()
 
-        new_row_ids = []
+        new_rows = []
 
-        for message in messages:
-            # Insert the new message
+        if messages:
             await cursor.execute(
                 f"""
             INSERT INTO {chat_history_table_name} (user_id, question_id, role, content, response_type, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
+            VALUES {', '.join(['(?, ?, ?, ?, ?, ?)' for _ in messages])}
+            RETURNING id, created_at, user_id, question_id, role, content, response_type
             """,
-                (
-                    user_id,
-                    question_id,
-                    message.role,
-                    message.content,
-                    message.response_type,
-                    message.created_at,
+                tuple(
+                    value
+                    for message in messages
+                    for value in (
+                        user_id,
+                        question_id,
+                        message.role,
+                        message.content,
+                        message.response_type,
+                        message.created_at,
+                    )
                 ),
             )
 
-            new_row_id = cursor.lastrowid
-            new_row_ids.append(new_row_id)
+            # SQLite does not guarantee the order of the rows from RETURNING
+            new_rows = sorted(await cursor.fetchall(), key=lambda row: row[0])
 
         if is_complete:
             await cursor.execute(
@@ -54,16 +58,7 @@ async def store_messages(
 
         await conn.commit()
 
-    # Fetch the newly inserted row
-    new_rows = await execute_db_operation(
-        f"""SELECT id, created_at, user_id, question_id, role, content, response_type
-    FROM {chat_history_table_name}
-    WHERE id IN ({','.join(map(str, new_row_ids))})
-    """,
-        fetch_all=True,
-    )
-
-    # Return the newly inserted row as a dictionary
+    # Return the newly inserted rows as dictionaries
     return [
         {
             "id": new_row[0],
@@ -8,6 +8,7 @@ from api.utils.db import execute_db_operation
 async def upsert_user_code_draft(user_id: int, question_id: int, code: List[Dict]):
     """Insert or update a code draft for a (user_id, question_id) pair."""
 
+    # autosaves often resend unchanged code; skip rewriting the row in that case
     await execute_db_operation(
         f"""
         INSERT INTO {code_drafts_table_name} (user_id, question_id, code)
@@ -15,6 +16,7 @@ async def upsert_user_code_draft(user_id: int, question_id: int, code: List[Dict
         ON CONFLICT(user_id, question_id) DO UPDATE SET
             code = excluded.code,
             updated_at = CURRENT_TIMESTAMP
+        WHERE code IS NOT excluded.code
         """,
         (user_id, question_id, json.dumps(code)),
     )
@@ -1,7 +1,6 @@
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional, Dict, Tuple
 from dateutil.relativedelta import relativedelta
-from collections import defaultdict
 from api.models import TaskType, TaskStatus
 from api.config import (
     cohorts_table_name,
@@ -22,7 +21,10 @@ from api.utils.db import (
 )
 from api.db.user import insert_or_return_user
 from api.db.course import get_course
-from api.slack import send_slack_notification_for_learner_added_to_cohort
+from api.slack import (
+    send_slack_notification_for_learner_added_to_cohort,
+    send_slack_notifications,
+)
 
 
 async def add_courses_to_cohort(
@@ -216,11 +218,13 @@ async def add_members_to_cohort(
             )
             users_to_add.append(user)
 
+        user_ids = [user["id"] for user in users_to_add]
+
         await cursor.execute(
             f"""
-            SELECT 1 FROM {user_cohorts_table_name} WHERE user_id IN ({','.join(['?' for _ in [user["id"] for user in users_to_add]])}) AND cohort_id = ?
+            SELECT 1 FROM {user_cohorts_table_name} WHERE user_id IN ({','.join(['?' for _ in user_ids])}) AND cohort_id = ?
             """,
-            (*[user["id"] for user in users_to_add], cohort_id),
+            (*user_ids, cohort_id),
         )
 
         user_exists = await cursor.fetchone()
@@ -228,22 +232,26 @@ async def add_members_to_cohort(
         if user_exists:
             raise Exception("User already exists in cohort")
 
-        for user in users_to_add:
-            await send_slack_notification_for_learner_added_to_cohort(
-                user, org_slug, org_id, cohort[0], cohort_id
-            )
-
         # Add users to cohort
         await cursor.executemany(
             f"""
             INSERT INTO {user_cohorts_table_name} (user_id, cohort_id, role)
             VALUES (?, ?, ?)
             """,
-            [(user["id"], cohort_id, role) for user, role in zip(users_to_add, roles)],
+            [(user_id, cohort_id, role) for user_id, role in zip(user_ids, roles)],
         )
 
         await conn.commit()
 
+    await send_slack_notifications(
+        [
+            send_slack_notification_for_learner_added_to_cohort(
+                user, org_slug, org_id, cohort[0], cohort_id
+            )
+            for user in users_to_add
+        ]
+    )
+
 
 async def remove_members_from_cohort(cohort_id: int, member_ids: List[int]):
     members_in_cohort = await execute_db_operation(
@@ -367,14 +375,13 @@ async def is_user_in_cohort(user_id: int, cohort_id: int):
 
 
 def format_user_cohort_group(group: Tuple):
-    learners = []
-    for id, email in zip(group[2].split(","), group[3].split(",")):
-        learners.append({"id": int(id), "email": email})
-
     return {
         "id": group[0],
         "name": group[1],
-        "learners": learners,
+        "learners": [
+            {"id": int(id), "email": email}
+            for id, email in zip(group[2].split(","), group[3].split(","))
+        ],
     }
 
 
@@ -414,39 +421,27 @@ async def get_cohort_analytics_metrics_for_tasks(cohort_id: int, task_ids: List[
     )
 
     user_metrics = []
-    task_metrics = defaultdict(list)
     for row in results:
         user_task_completions = [
             int(x) if x else 0 for x in (row[3].split(",") if row[3] else [])
         ]
         user_task_ids = list(map(int, row[2].split(","))) if row[2] else []
 
-        for task_id, task_completion in zip(user_task_ids, user_task_completions):
-            task_metrics[task_id].append(task_completion)
-
-        for task_id in task_ids:
-            if task_id in user_task_ids:
-                continue
-
-            # this user did not attempt this task - add default
-            task_metrics[task_id].append(0)
-
-        num_completed = sum(user_task_completions)
+        # build the user's row in one go; tasks not attempted default to 0
+        user_task_completion = dict(zip(user_task_ids, user_task_completions))
 
         user_metrics.append(
             {
                 "user_id": row[0],
                 "email": row[1],
-                "num_completed": num_completed,
+                "num_completed": sum(user_task_completions),
+                **{
+                    f"task_{task_id}": user_task_completion.get(task_id, 0)
+                    for task_id in task_ids
+                },
             }
         )
 
-    task_metrics = {task_id: task_metrics[task_id] for task_id in task_ids}
-
-    for index, row in enumerate(user_metrics):
-        for task_id in task_ids:
-            row[f"task_{task_id}"] = task_metrics[task_id][index]
-
     return user_metrics
 
 
@@ -486,7 +481,6 @@ async def get_cohort_attempt_data_for_tasks(cohort_id: int, task_ids: List[int])
     )
 
     user_metrics = []
-    task_attempts = defaultdict(list)
 
     for row in results:
         user_task_attempts_data = [
@@ -494,31 +488,20 @@ async def get_cohort_attempt_data_for_tasks(cohort_id: int, task_ids: List[int])
         ]
         user_task_ids = list(map(int, row[2].split(","))) if row[2] else []
 
-        for task_id, task_attempt in zip(user_task_ids, user_task_attempts_data):
-            task_attempts[task_id].append(task_attempt)
-
-        for task_id in task_ids:
-            if task_id in user_task_ids:
-                continue
-
-            task_attempts[task_id].append(0)
-
-        num_attempted = sum(user_task_attempts_data)
+        user_task_attempts = dict(zip(user_task_ids, user_task_attempts_data))
 
         user_metrics.append(
             {
                 "user_id": row[0],
                 "email": row[1],
-                "num_attempted": num_attempted,
+                "num_attempted": sum(user_task_attempts_data),
+                **{
+                    f"task_{task_id}": user_task_attempts.get(task_id, 0)
+                    for task_id in task_ids
+                },
             }
         )
 
-    task_attempts = {task_id: task_attempts[task_id] for task_id in task_ids}
-
-    for index, row in enumerate(user_metrics):
-        for task_id in task_ids:
-            row[f"task_{task_id}"] = task_attempts[task_id][index]
-
     return user_metrics
 
 
@@ -812,15 +812,12 @@ async def add_tasks_to_courses(course_tasks_to_add: List[Tuple[int, int, int]]):
             max_ordering = (await cursor.fetchone())[0]
 
             # Insert tasks with incremented ordering
-            values_to_insert = []
-            for i, (task_id, milestone_id) in enumerate(task_details, start=1):
-                values_to_insert.append(
-                    (task_id, course_id, max_ordering + i, milestone_id)
-                )
-
             await cursor.executemany(
                 f"INSERT OR IGNORE INTO {course_tasks_table_name} (task_id, course_id, ordering, milestone_id) VALUES (?, ?, ?, ?)",
-                values_to_insert,
+                [
+                    (task_id, course_id, max_ordering + i, milestone_id)
+                    for i, (task_id, milestone_id) in enumerate(task_details, start=1)
+                ],
             )
 
         await conn.commit()
@@ -849,7 +846,6 @@ async def add_milestone_to_course(
     async with get_new_db_connection() as conn:
         cursor = await conn.cursor()
 
-        # Get the max ordering value for this course
         await cursor.execute(
             f"INSERT INTO {milestones_table_name} (name, color, org_id) VALUES (?, ?, ?)",
             (milestone_name, milestone_color, org_id),
@@ -857,19 +853,18 @@ async def add_milestone_to_course(
 
         milestone_id = cursor.lastrowid
 
+        # Place the milestone after the course's last one, computing the
+        # ordering in the same statement as the insert
         await cursor.execute(
-            f"SELECT COALESCE(MAX(ordering), -1) FROM {course_milestones_table_name} WHERE course_id = ?",
-            (course_id,),
-        )
-        max_ordering = await cursor.fetchone()
-
-        # Set the new milestone's order to be the next value
-        next_order = max_ordering[0] + 1 if max_ordering else 0
-
-        await cursor.execute(
-            f"INSERT INTO {course_milestones_table_name} (course_id, milestone_id, ordering) VALUES (?, ?, ?)",
-            (course_id, milestone_id, next_order),
+            f"""
+            INSERT INTO {course_milestones_table_name} (course_id, milestone_id, ordering)
+            SELECT ?, ?, COALESCE(MAX(ordering), -1) + 1
+            FROM {course_milestones_table_name} WHERE course_id = ?
+            RETURNING ordering
+            """,
+            (course_id, milestone_id, course_id),
         )
+        next_order = (await cursor.fetchone())[0]
 
         await conn.commit()
 
@@ -940,15 +935,17 @@ async def get_user_courses(user_id: int) -> List[Dict]:
         if not course_roles:
             return []
 
-        # Fetch detailed information for all course IDs
+        # Fetch detailed information for all course IDs in a single query
+        course_ids = list(course_roles.keys())
+        await cursor.execute(
+            f"SELECT c.id, c.name, o.id, o.name, o.slug FROM {courses_table_name} c JOIN {organizations_table_name} o ON c.org_id = o.id WHERE c.id IN ({','.join(['?' for _ in course_ids])})",
+            course_ids,
+        )
+        course_rows = {row[0]: row for row in await cursor.fetchall()}
+
         courses = []
         for course_id, role in course_roles.items():
-            # Fetch course from DB including org_id
-            await cursor.execute(
-                f"SELECT c.id, c.name, o.id, o.name, o.slug FROM {courses_table_name} c JOIN {organizations_table_name} o ON c.org_id = o.id WHERE c.id = ?",
-                (course_id,),
-            )
-            course_row = await cursor.fetchone()
+            course_row = course_rows.get(course_id)
             if course_row:
                 course_dict = convert_course_db_to_dict(course_row)
                 course_dict["role"] = role  # Add user's role to the course dictionary
@@ -529,32 +529,24 @@ async def get_session_analysis(session_uuid: str) -> Dict[str, Any]:
     events = await get_session_events(session_uuid)
     flags = await get_session_flags(session_uuid)
     
-    # Calculate integrity score
+    # Flag count, event type and severity distributions in a single pass over the events
     total_events = len(events)
-    flagged_events = len([e for e in events if e['flagged']])
-    high_severity_events = len([e for e in events if e['severity'] == 'high'])
-    medium_severity_events = len([e for e in events if e['severity'] == 'medium'])
+    flagged_events = 0
+    event_types = {}
+    severity_counts = {'low': 0, 'medium': 0, 'high': 0}
+    for event in events:
+        if event['flagged']:
+            flagged_events += 1
+        event_types[event['event_type']] = event_types.get(event['event_type'], 0) + 1
+        severity_counts[event['severity']] += 1
     
     # Simple scoring algorithm
     if total_events == 0:
         integrity_score = 100.0
     else:
-        penalty = (high_severity_events * 10) + (medium_severity_events * 5) + (flagged_events * 3)
+        penalty = (severity_counts['high'] * 10) + (severity_counts['medium'] * 5) + (flagged_events * 3)
         integrity_score = max(0, 100 - (penalty / total_events * 10))
     
-    # Event type distribution
-    event_types = {}
-    for event in events:
-        event_type = event['event_type']
-        if event_type not in event_types:
-            event_types[event_type] = 0
-        event_types[event_type] += 1
-    
-    # Severity distribution
-    severity_counts = {'low': 0, 'medium': 0, 'high': 0}
-    for event in events:
-        severity_counts[event['severity']] += 1
-    
     return {
         'session': session,
         'integrity_score': round(integrity_score, 2),
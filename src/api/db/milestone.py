@@ -1,4 +1,6 @@
 from typing import Dict, Tuple
+from itertools import chain
+import asyncio
 from api.utils.db import execute_db_operation, execute_multiple_db_operations
 from api.config import (
     milestones_table_name,
@@ -61,7 +63,7 @@ async def delete_milestone(milestone_id: int):
 
 async def get_user_metrics_for_all_milestones(user_id: int, course_id: int):
     # Get milestones with tasks
-    base_results = await execute_db_operation(
+    base_query = execute_db_operation(
         f"""
         SELECT 
             m.id AS milestone_id,
@@ -104,7 +106,7 @@ async def get_user_metrics_for_all_milestones(user_id: int, course_id: int):
     )
 
     # Get tasks with null milestone_id
-    null_milestone_results = await execute_db_operation(
+    null_milestone_query = execute_db_operation(
         f"""
         SELECT 
             NULL AS milestone_id,
@@ -143,7 +145,10 @@ async def get_user_metrics_for_all_milestones(user_id: int, course_id: int):
         fetch_all=True,
     )
 
-    results = base_results + null_milestone_results
+    # the two queries are independent, so run them concurrently
+    base_results, null_milestone_results = await asyncio.gather(
+        base_query, null_milestone_query
+    )
 
     return [
         {
@@ -153,5 +158,5 @@ async def get_user_metrics_for_all_milestones(user_id: int, course_id: int):
             "total_tasks": row[3],
             "completed_tasks": row[4],
         }
-        for row in results
+        for row in chain(base_results, null_milestone_results)
     ]
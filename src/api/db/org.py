@@ -16,6 +16,7 @@ from api.db.user import get_user_by_id, insert_or_return_user
 from api.slack import (
     send_slack_notification_for_new_org,
     send_slack_notification_for_member_added_to_org,
+    send_slack_notifications,
 )
 
 
@@ -173,30 +174,16 @@ async def get_hva_org_id():
     return hva_org_id
 
 
-async def get_hva_cohort_ids() -> List[int]:
-    hva_org_id = await get_hva_org_id()
-
-    if hva_org_id is None:
-        return []
-
-    cohorts = await execute_db_operation(
-        "SELECT id FROM cohorts WHERE org_id = ?",
-        (hva_org_id,),
-        fetch_all=True,
-    )
-    return [cohort[0] for cohort in cohorts]
-
-
 async def is_user_hva_learner(user_id: int) -> bool:
-    hva_cohort_ids = await get_hva_cohort_ids()
-
-    if not hva_cohort_ids:
-        return False
-
     num_hva_users_matching_user_id = (
         await execute_db_operation(
-            f"SELECT COUNT(*) FROM user_cohorts WHERE user_id = ? AND cohort_id IN ({', '.join(map(str, hva_cohort_ids))}) AND role = 'learner'",
-            (user_id,),
+            """
+            SELECT COUNT(*) FROM user_cohorts uc
+            JOIN cohorts c ON c.id = uc.cohort_id
+            WHERE uc.user_id = ? AND uc.role = 'learner'
+            AND c.org_id = (SELECT id FROM organizations WHERE name = ?)
+            """,
+            (user_id, "HyperVerge Academy"),
             fetch_one=True,
         )
     )[0]
@@ -221,14 +208,11 @@ async def add_users_to_org_by_email(
     async with get_new_db_connection() as conn:
         cursor = await conn.cursor()
 
-        user_ids = []
+        users = []
         for email in emails:
-            user = await insert_or_return_user(cursor, email)
-            user_ids.append(user["id"])
+            users.append(await insert_or_return_user(cursor, email))
 
-            await send_slack_notification_for_member_added_to_org(
-                user, org["slug"], org_id
-            )
+        user_ids = [user["id"] for user in users]
 
         # Check if any of the users are already in the organization
         placeholders = ", ".join(["?" for _ in user_ids])
@@ -253,6 +237,13 @@ async def add_users_to_org_by_email(
         )
         await conn.commit()
 
+    await send_slack_notifications(
+        [
+            send_slack_notification_for_member_added_to_org(user, org["slug"], org_id)
+            for user in users
+        ]
+    )
+
 
 async def remove_members_from_org(org_id: int, user_ids: List[int]):
     query = f"DELETE FROM {user_organizations_table_name} WHERE org_id = ? AND user_id IN ({', '.join(map(str, user_ids))})"
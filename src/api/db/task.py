@@ -20,6 +20,7 @@ from api.config import (
 from api.utils.db import (
     get_new_db_connection,
     execute_db_operation,
+    execute_multiple_db_operations,
     serialise_list_to_str,
 )
 from api.models import (
@@ -729,17 +730,26 @@ async def mark_task_completed(task_id: int, user_id: int):
 async def delete_completion_history_for_task(
     task_id: int, question_id: int, user_id: int
 ):
+    commands_and_params = []
+
     if task_id is not None:
-        await execute_db_operation(
-            f"DELETE FROM {chat_history_table_name} WHERE task_id = ? AND user_id = ?",
-            (task_id, user_id),
+        commands_and_params.append(
+            (
+                f"DELETE FROM {chat_history_table_name} WHERE task_id = ? AND user_id = ?",
+                (task_id, user_id),
+            )
         )
 
-    await execute_db_operation(
-        f"DELETE FROM {chat_history_table_name} WHERE question_id = ? AND user_id = ?",
-        (question_id, user_id),
+    commands_and_params.append(
+        (
+            f"DELETE FROM {chat_history_table_name} WHERE question_id = ? AND user_id = ?",
+            (question_id, user_id),
+        )
     )
 
+    # run both deletes on one connection and in one transaction
+    await execute_multiple_db_operations(commands_and_params)
+
 
 async def schedule_module_tasks(
     course_id: int, module_id: int, scheduled_publish_at: datetime
@@ -757,11 +767,12 @@ async def schedule_module_tasks(
         if not course_module_tasks:
             return
 
-        for task in course_module_tasks:
-            await cursor.execute(
-                f"UPDATE {tasks_table_name} SET scheduled_publish_at = ? WHERE id = ?",
-                (scheduled_publish_at, task[0]),
-            )
+        task_ids = [task[0] for task in course_module_tasks]
+
+        await cursor.execute(
+            f"UPDATE {tasks_table_name} SET scheduled_publish_at = ? WHERE id IN ({','.join(['?' for _ in task_ids])})",
+            (scheduled_publish_at, *task_ids),
+        )
 
         await conn.commit()
 
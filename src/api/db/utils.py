@@ -35,23 +35,17 @@ def convert_blocks_to_right_format(blocks: List[Dict]) -> List[Dict]:
     return blocks
 
 
-def construct_description_from_blocks(
-    blocks: List[Dict], nesting_level: int = 0
-) -> str:
-    """
-    Constructs a textual description from a tree of block data.
-
-    Args:
-        blocks: A list of block dictionaries, potentially with nested children
-        nesting_level: The current nesting level (used for proper indentation)
+def _get_text_from_block_content(content: List) -> str:
+    return "".join(
+        text_obj["text"]
+        for text_obj in content
+        if isinstance(text_obj, dict) and "text" in text_obj
+    )
 
-    Returns:
-        A formatted string representing the content of the blocks
-    """
-    if not blocks:
-        return ""
 
-    description = ""
+def _add_description_parts_from_blocks(
+    blocks: List[Dict], nesting_level: int, parts: List[str]
+):
     indent = "    " * nesting_level  # 4 spaces per nesting level
 
     for block in blocks:
@@ -63,42 +57,30 @@ def construct_description_from_blocks(
         if block_type == "paragraph":
             # Content is a list of text objects
             if isinstance(content, list):
-                paragraph_text = ""
-                for text_obj in content:
-                    if isinstance(text_obj, dict) and "text" in text_obj:
-                        paragraph_text += text_obj["text"]
+                paragraph_text = _get_text_from_block_content(content)
                 if paragraph_text:
-                    description += f"{indent}{paragraph_text}\n"
+                    parts.append(f"{indent}{paragraph_text}\n")
 
         elif block_type == "heading":
             level = block.get("props", {}).get("level", 1)
             if isinstance(content, list):
-                heading_text = ""
-                for text_obj in content:
-                    if isinstance(text_obj, dict) and "text" in text_obj:
-                        heading_text += text_obj["text"]
+                heading_text = _get_text_from_block_content(content)
                 if heading_text:
                     # Headings are typically not indented, but we'll respect nesting for consistency
-                    description += f"{indent}{'#' * level} {heading_text}\n"
+                    parts.append(f"{indent}{'#' * level} {heading_text}\n")
 
         elif block_type == "codeBlock":
             language = block.get("props", {}).get("language", "")
             if isinstance(content, list):
-                code_text = ""
-                for text_obj in content:
-                    if isinstance(text_obj, dict) and "text" in text_obj:
-                        code_text += text_obj["text"]
+                code_text = _get_text_from_block_content(content)
                 if code_text:
-                    description += (
+                    parts.append(
                         f"{indent}```{language}\n{indent}{code_text}\n{indent}```\n"
                     )
 
         elif block_type in ["numberedListItem", "checkListItem", "bulletListItem"]:
             if isinstance(content, list):
-                item_text = ""
-                for text_obj in content:
-                    if isinstance(text_obj, dict) and "text" in text_obj:
-                        item_text += text_obj["text"]
+                item_text = _get_text_from_block_content(content)
                 if item_text:
                     # Use proper list marker based on parent list type
                     if block_type == "numberedListItem":
@@ -108,12 +90,30 @@ def construct_description_from_blocks(
                     elif block_type == "bulletListItem":
                         marker = "- "
 
-                    description += f"{indent}{marker}{item_text}\n"
+                    parts.append(f"{indent}{marker}{item_text}\n")
 
         if children:
-            child_description = construct_description_from_blocks(
-                children, nesting_level + 1
-            )
-            description += child_description
+            _add_description_parts_from_blocks(children, nesting_level + 1, parts)
+
+
+def construct_description_from_blocks(
+    blocks: List[Dict], nesting_level: int = 0
+) -> str:
+    """
+    Constructs a textual description from a tree of block data.
+
+    Args:
+        blocks: A list of block dictionaries, potentially with nested children
+        nesting_level: The current nesting level (used for proper indentation)
+
+    Returns:
+        A formatted string representing the content of the blocks
+    """
+    if not blocks:
+        return ""
+
+    # every block at every nesting level appends its text to the same list
+    parts = []
+    _add_description_parts_from_blocks(blocks, nesting_level, parts)
 
-    return description
+    return "".join(parts)
@@ -1,4 +1,5 @@
 from typing import Dict, List
+from functools import lru_cache
 import backoff
 import openai
 import instructor
@@ -30,9 +31,7 @@ def validate_openai_api_key(openai_api_key: str) -> bool:
     client = OpenAI(api_key=openai_api_key)
     try:
         models = client.models.list()
-        model_ids = [model.id for model in models.data]
-
-        if "gpt-4o-audio-preview-2024-12-17" in model_ids:
+        if any(model.id == "gpt-4o-audio-preview-2024-12-17" for model in models.data):
             return False  # paid account
         else:
             return True  # free trial account
@@ -40,6 +39,23 @@ def validate_openai_api_key(openai_api_key: str) -> bool:
         return None
 
 
+@lru_cache
+def get_async_openai_client(api_key: str) -> openai.AsyncOpenAI:
+    # reuse one client per api key so that its connection pool (and the
+    # keep-alive connections to the OpenAI API) survive across requests
+    return openai.AsyncOpenAI(api_key=api_key)
+
+
+@lru_cache
+def get_openai_client(api_key: str) -> openai.OpenAI:
+    return openai.OpenAI(api_key=api_key)
+
+
+@lru_cache
+def get_instructor_client(api_key: str) -> instructor.AsyncInstructor:
+    return instructor.from_openai(get_async_openai_client(api_key))
+
+
 @backoff.on_exception(backoff.expo, Exception, max_tries=5, factor=2)
 async def run_llm_with_instructor(
     api_key: str,
@@ -48,7 +64,7 @@ async def run_llm_with_instructor(
     response_model: BaseModel,
     max_completion_tokens: int,
 ):
-    client = instructor.from_openai(openai.AsyncOpenAI(api_key=api_key))
+    client = get_instructor_client(api_key)
 
     model_kwargs = {}
 
@@ -74,7 +90,7 @@ async def stream_llm_with_instructor(
     max_completion_tokens: int,
     **kwargs,
 ):
-    client = instructor.from_openai(openai.AsyncOpenAI(api_key=api_key))
+    client = get_instructor_client(api_key)
 
     model_kwargs = {}
 
@@ -101,7 +117,7 @@ def stream_llm_with_openai(
     messages: List,
     max_completion_tokens: int,
 ):
-    client = openai.OpenAI(api_key=api_key)
+    client = get_openai_client(api_key)
 
     model_kwargs = {}
 
@@ -70,15 +70,13 @@ async def get_tasks_for_course(
     except ValueError:
         raise HTTPException(status_code=404, detail="Course not found")
 
+    # org_id was resolved from the API key above
     if org_id != course_org_id:
         raise HTTPException(
             status_code=403,
             detail="Invalid API key",
         )
 
-    # Validate the API key for the given org_id
-    await validate_api_key(api_key=api_key, org_id=org_id)
-
     course = await get_course_from_db(course_id=course_id)
 
     for milestone in course["milestones"]:
@@ -1,15 +1,13 @@
-from ast import List
 import os
 import tempfile
 import random
 from collections import defaultdict
+from functools import lru_cache
 import asyncio
 from fastapi import APIRouter, HTTPException, Body, BackgroundTasks
 from fastapi.responses import StreamingResponse
 from typing import List, Optional, Dict, Literal, AsyncGenerator
 import json
-import instructor
-import openai
 from pydantic import BaseModel, Field
 from langchain_core.output_parsers import PydanticOutputParser
 from api.config import openai_plan_to_model_name
@@ -23,7 +21,12 @@ from api.models import (
     GenerateTaskJobStatus,
     QuestionType,
 )
-from api.llm import run_llm_with_instructor, stream_llm_with_instructor
+from api.llm import (
+    run_llm_with_instructor,
+    stream_llm_with_instructor,
+    get_async_openai_client,
+    get_instructor_client,
+)
 from api.settings import settings
 from api.utils.logging import logger
 from api.utils.concurrency import async_batch_gather
@@ -87,7 +90,20 @@ def get_user_audio_message_for_chat_history(uuid: str) -> List[Dict]:
     ]
 
 
-def get_ai_message_for_chat_history(ai_message: Dict) -> str:
+async def get_user_audio_messages_for_chat_history(
+    uuids: List[str],
+) -> List[List[Dict]]:
+    # each audio file is downloaded and encoded in a worker thread so that the
+    # event loop is not blocked while reading it
+    return await asyncio.gather(
+        *[
+            asyncio.to_thread(get_user_audio_message_for_chat_history, uuid)
+            for uuid in uuids
+        ]
+    )
+
+
+def get_ai_message_for_chat_history(ai_message: str) -> str:
     message = json.loads(ai_message)
 
     if "scorecard" not in message or not message["scorecard"]:
@@ -116,6 +132,102 @@ def get_user_message_for_chat_history(user_response: str) -> str:
     return f"""Student's Response:\n```\n{user_response}\n```"""
 
 
+@lru_cache
+def chat_query_rewrite_schema():
+    class Output(BaseModel):
+        rewritten_query: str = Field(
+            description="The rewritten query/message of the student"
+        )
+
+    return Output
+
+
+@lru_cache
+def chat_router_schema():
+    class Output(BaseModel):
+        use_reasoning_model: bool = Field(
+            description="Whether to use a reasoning model to evaluate the student's response"
+        )
+
+    return Output
+
+
+@lru_cache
+def chat_objective_question_feedback_schema():
+    class Output(BaseModel):
+        analysis: str = Field(
+            description="A detailed analysis of the student's response"
+        )
+        feedback: str = Field(
+            description="Feedback on the student's response; add newline characters to the feedback to make it more readable where necessary"
+        )
+        is_correct: bool = Field(
+            description="Whether the student's response correctly solves the original task that the student is supposed to solve. For this to be true, the original task needs to be completely solved and not just partially solved. Giving the right answer to one step of the task does not count as solving the entire task."
+        )
+
+    return Output
+
+
+@lru_cache
+def chat_subjective_question_feedback_schema():
+    class Feedback(BaseModel):
+        correct: Optional[str] = Field(
+            description="What worked well in the student's response for this category based on the scoring criteria"
+        )
+        wrong: Optional[str] = Field(
+            description="What needs improvement in the student's response for this category based on the scoring criteria"
+        )
+
+    class Row(BaseModel):
+        category: str = Field(
+            description="Category from the scoring criteria for which the feedback is being provided"
+        )
+        feedback: Feedback = Field(
+            description="Detailed feedback for the student's response for this category"
+        )
+        score: int = Field(
+            description="Score given within the min/max range for this category based on the student's response - the score given should be in alignment with the feedback provided"
+        )
+        max_score: int = Field(
+            description="Maximum score possible for this category as per the scoring criteria"
+        )
+        pass_score: int = Field(
+            description="Pass score possible for this category as per the scoring criteria"
+        )
+
+    class Output(BaseModel):
+        feedback: str = Field(
+            description="A single, comprehensive summary based on the scoring criteria"
+        )
+        scorecard: Optional[List[Row]] = Field(
+            description="List of rows with one row for each category from scoring criteria; only include this in the response if the student's response is an answer to the task"
+        )
+
+    return Output
+
+
+@lru_cache
+def chat_learning_material_response_schema():
+    class Output(BaseModel):
+        response: str = Field(
+            description="Response to the student's query; add proper formatting to the response to make it more readable where necessary"
+        )
+
+    return Output
+
+
+@lru_cache
+def get_format_instructions(output_model) -> str:
+    return PydanticOutputParser(pydantic_object=output_model).get_format_instructions()
+
+
+@lru_cache
+def get_chat_router_system_prompt() -> str:
+    format_instructions = get_format_instructions(chat_router_schema())
+
+    return f"""You are an intelligent routing agent that decides which type of language model should be used to evaluate a student's response to a given task. You will receive the details of a task, the conversation history with the student and the student's latest query/message.\n\nYou have two options:\n- Reasoning Model (e.g. o3): Best for complex tasks involving logical deduction, problem-solving, code generation, mathematics, research reasoning, multi-step analysis, or edge-case handling.\n- General-Purpose Model (e.g. gpt-4o): Best for everyday conversation, writing help, summaries, rephrasing, explanations, casual queries, grammar correction, and general knowledge Q&A.\n\nYour job is to classify which of the two options is best suited to evaluate the student's response for the given task. If a task can be solved by a general purpose model, avoid using a reasoning model as it takes longer and costs more. At the same time, accuracy cannot be compromised.\n\n{format_instructions}"""
+
+
 @router.post("/chat")
 async def ai_response_for_question(request: AIChatRequest):
     metadata = {"task_id": request.task_id, "user_id": request.user_id}
@@ -207,13 +319,22 @@ async def ai_response_for_question(request: AIChatRequest):
     if task_metadata:
         metadata.update(task_metadata)
 
+    if request.response_type == ChatResponseType.AUDIO:
+        user_messages = [
+            message for message in chat_history if message["role"] == "user"
+        ]
+        # the current response is loaded in the same batch as the past ones
+        *audio_messages, user_message = await get_user_audio_messages_for_chat_history(
+            [message["content"] for message in user_messages] + [request.user_response]
+        )
+        for message, audio_message in zip(user_messages, audio_messages):
+            message["content"] = audio_message
+    else:
+        user_message = get_user_message_for_chat_history(request.user_response)
+
     for message in chat_history:
         if message["role"] == "user":
-            if request.response_type == ChatResponseType.AUDIO:
-                message["content"] = get_user_audio_message_for_chat_history(
-                    message["content"]
-                )
-            else:
+            if request.response_type != ChatResponseType.AUDIO:
                 message["content"] = get_user_message_for_chat_history(
                     message["content"]
                 )
@@ -223,12 +344,6 @@ async def ai_response_for_question(request: AIChatRequest):
 
             message["content"] = get_ai_message_for_chat_history(message["content"])
 
-    user_message = (
-        get_user_audio_message_for_chat_history(request.user_response)
-        if request.response_type == ChatResponseType.AUDIO
-        else get_user_message_for_chat_history(request.user_response)
-    )
-
     user_message = {"role": "user", "content": user_message}
 
     if request.task_type == TaskType.QUIZ:
@@ -236,23 +351,22 @@ async def ai_response_for_question(request: AIChatRequest):
             answer_as_prompt = construct_description_from_blocks(question["answer"])
             question_details += f"""\n\nReference Solution (never to be shared with the learner):\n```\n{answer_as_prompt}\n```"""
         else:
-            scoring_criteria_as_prompt = ""
-
-            for criterion in question["scorecard"]["criteria"]:
-                scoring_criteria_as_prompt += f"""- **{criterion['name']}** [min: {criterion['min_score']}, max: {criterion['max_score']}, pass: {criterion.get('pass_score', criterion['max_score'])}]: {criterion['description']}\n"""
+            scoring_criteria_as_prompt = "".join(
+                f"""- **{criterion['name']}** [min: {criterion['min_score']}, max: {criterion['max_score']}, pass: {criterion.get('pass_score', criterion['max_score'])}]: {criterion['description']}\n"""
+                for criterion in question["scorecard"]["criteria"]
+            )
 
             question_details += (
                 f"""\n\nScoring Criteria:\n```\n{scoring_criteria_as_prompt}\n```"""
             )
 
-    chat_history = (
-        chat_history
-        + [user_message]
-        + [
+    chat_history.extend(
+        [
+            user_message,
             {
                 "role": "user",
                 "content": question_details,
-            }
+            },
         ]
     )
 
@@ -274,19 +388,15 @@ async def ai_response_for_question(request: AIChatRequest):
                     model = openai_plan_to_model_name["text-mini"]
 
                     messages = [
-                        {"role": "system", "content": system_prompt}
-                    ] + chat_history
-
-                    class Output(BaseModel):
-                        rewritten_query: str = Field(
-                            description="The rewritten query/message of the student"
-                        )
+                        {"role": "system", "content": system_prompt},
+                        *chat_history,
+                    ]
 
                     pred = await run_llm_with_instructor(
                         api_key=settings.openai_api_key,
                         model=model,
                         messages=messages,
-                        response_model=Output,
+                        response_model=chat_query_rewrite_schema(),
                         max_completion_tokens=8192,
                     )
 
@@ -294,30 +404,24 @@ async def ai_response_for_question(request: AIChatRequest):
                         pred.rewritten_query
                     )
 
-            output_buffer = []
+            # each partial chunk carries the whole response so far, so only the
+            # latest serialized chunk needs to be kept for the trace output
+            output_buffer = ""
 
             try:
                 if request.response_type == ChatResponseType.AUDIO:
                     model = openai_plan_to_model_name["audio"]
                 else:
 
-                    class Output(BaseModel):
-                        use_reasoning_model: bool = Field(
-                            description="Whether to use a reasoning model to evaluate the student's response"
-                        )
-
-                    format_instructions = PydanticOutputParser(
-                        pydantic_object=Output
-                    ).get_format_instructions()
-
-                    system_prompt = f"""You are an intelligent routing agent that decides which type of language model should be used to evaluate a student's response to a given task. You will receive the details of a task, the conversation history with the student and the student's latest query/message.\n\nYou have two options:\n- Reasoning Model (e.g. o3): Best for complex tasks involving logical deduction, problem-solving, code generation, mathematics, research reasoning, multi-step analysis, or edge-case handling.\n- General-Purpose Model (e.g. gpt-4o): Best for everyday conversation, writing help, summaries, rephrasing, explanations, casual queries, grammar correction, and general knowledge Q&A.\n\nYour job is to classify which of the two options is best suited to evaluate the student's response for the given task. If a task can be solved by a general purpose model, avoid using a reasoning model as it takes longer and costs more. At the same time, accuracy cannot be compromised.\n\n{format_instructions}"""
+                    system_prompt = get_chat_router_system_prompt()
 
                     messages = [
                         {
                             "role": "system",
                             "content": system_prompt,
-                        }
-                    ] + chat_history
+                        },
+                        *chat_history,
+                    ]
 
                     with using_attributes(
                         session_id=session_id,
@@ -328,7 +432,7 @@ async def ai_response_for_question(request: AIChatRequest):
                             api_key=settings.openai_api_key,
                             model=openai_plan_to_model_name["router"],
                             messages=messages,
-                            response_model=Output,
+                            response_model=chat_router_schema(),
                             max_completion_tokens=4096,
                         )
 
@@ -341,62 +445,13 @@ async def ai_response_for_question(request: AIChatRequest):
 
                 if request.task_type == TaskType.QUIZ:
                     if question["type"] == QuestionType.OBJECTIVE:
-
-                        class Output(BaseModel):
-                            analysis: str = Field(
-                                description="A detailed analysis of the student's response"
-                            )
-                            feedback: str = Field(
-                                description="Feedback on the student's response; add newline characters to the feedback to make it more readable where necessary"
-                            )
-                            is_correct: bool = Field(
-                                description="Whether the student's response correctly solves the original task that the student is supposed to solve. For this to be true, the original task needs to be completely solved and not just partially solved. Giving the right answer to one step of the task does not count as solving the entire task."
-                            )
-
+                        Output = chat_objective_question_feedback_schema()
                     else:
-
-                        class Feedback(BaseModel):
-                            correct: Optional[str] = Field(
-                                description="What worked well in the student's response for this category based on the scoring criteria"
-                            )
-                            wrong: Optional[str] = Field(
-                                description="What needs improvement in the student's response for this category based on the scoring criteria"
-                            )
-
-                        class Row(BaseModel):
-                            category: str = Field(
-                                description="Category from the scoring criteria for which the feedback is being provided"
-                            )
-                            feedback: Feedback = Field(
-                                description="Detailed feedback for the student's response for this category"
-                            )
-                            score: int = Field(
-                                description="Score given within the min/max range for this category based on the student's response - the score given should be in alignment with the feedback provided"
-                            )
-                            max_score: int = Field(
-                                description="Maximum score possible for this category as per the scoring criteria"
-                            )
-                            pass_score: int = Field(
-                                description="Pass score possible for this category as per the scoring criteria"
-                            )
-
-                        class Output(BaseModel):
-                            feedback: str = Field(
-                                description="A single, comprehensive summary based on the scoring criteria"
-                            )
-                            scorecard: Optional[List[Row]] = Field(
-                                description="List of rows with one row for each category from scoring criteria; only include this in the response if the student's response is an answer to the task"
-                            )
-
+                        Output = chat_subjective_question_feedback_schema()
                 else:
+                    Output = chat_learning_material_response_schema()
 
-                    class Output(BaseModel):
-                        response: str = Field(
-                            description="Response to the student's query; add proper formatting to the response to make it more readable where necessary"
-                        )
-
-                parser = PydanticOutputParser(pydantic_object=Output)
-                format_instructions = parser.get_format_instructions()
+                format_instructions = get_format_instructions(Output)
 
                 if request.task_type == TaskType.QUIZ:
                     knowledge_base = None
@@ -405,11 +460,19 @@ async def ai_response_for_question(request: AIChatRequest):
                         linked_learning_material_ids = question["context"][
                             "linkedMaterialIds"
                         ]
-                        knowledge_blocks = question["context"]["blocks"]
+                        # shallow copy so that the linked material blocks added
+                        # below do not get appended to the question's own context
+                        knowledge_blocks = list(question["context"]["blocks"])
 
                         if linked_learning_material_ids:
-                            for id in linked_learning_material_ids:
-                                task = await get_task(int(id))
+                            # fetch all the linked materials concurrently
+                            linked_tasks = await asyncio.gather(
+                                *[
+                                    get_task(int(id))
+                                    for id in linked_learning_material_ids
+                                ]
+                            )
+                            for task in linked_tasks:
                                 if task:
                                     knowledge_blocks += task["blocks"]
 
@@ -428,7 +491,7 @@ async def ai_response_for_question(request: AIChatRequest):
                 else:
                     system_prompt = f"""You are a teaching assistant.\n\nYou will receive:\n- A Reference Material\n- Conversation history with a student\n- The student's latest query/message.\n\nYour role:\n- You need to respond to the student's message based on the content in the reference material provided to you.\n- If the student's query is absolutely not relevant to the reference material or goes beyond the scope of the reference material, clearly saying so without indulging their irrelevant queries. The only exception is when they are asking deeper questions related to the learning material that might not be mentioned in the reference material itself to clarify their conceptual doubts. In this case, you can provide the answer and help them.\n- Remember that the reference material is in read-only mode for the student. So, they cannot make any changes to it.\n\n{format_instructions}\n\nGuidelines on your response style:\n- Be crisp, concise and to the point.\n- Vary your phrasing to avoid monotony; occasionally include emojis to maintain warmth and engagement.\n- Playfully redirect irrelevant responses back to the task without judgment.\n- If the task involves code, format code snippets or variable/function names with backticks (`example`).\n- If including HTML, wrap tags in backticks (`<html>`).\n- If your response includes rich text format like lists, font weights, tables, etc. always render them as markdown.\n- Avoid being unnecessarily verbose in your response.\n\nGuideline on maintaining focus:\n- Your role is that of a teaching assistant for this particular task and its related concepts only. Remember that and absolutely avoid steering the conversation in any other direction apart from the actual task and its related concepts give to you.\n- If the student tries to move the focus of the conversation away from the task and its related concepts, gently bring it back.\n- It is very important that you prevent the focus on the conversation with the student being shifted away from the task and its related concepts given to you at all odds. No matter what happens. Stay on the task and its related concepts. Keep bringing the student back to the task and its related concepts. Do not let the conversation drift away."""
 
-                messages = [{"role": "system", "content": system_prompt}] + chat_history
+                messages = [{"role": "system", "content": system_prompt}, *chat_history]
 
                 with using_attributes(
                     session_id=f"{session_id}",
@@ -444,7 +507,7 @@ async def ai_response_for_question(request: AIChatRequest):
                     )
                     # Process the async generator
                     async for chunk in stream:
-                        content = json.dumps(chunk.model_dump()) + "\n"
+                        content = chunk.model_dump_json() + "\n"
                         output_buffer = content
                         yield content
             except Exception as error:
@@ -452,7 +515,7 @@ async def ai_response_for_question(request: AIChatRequest):
                 span.set_status(Status(StatusCode.ERROR))
                 raise error
             else:
-                span.set_output("".join(output_buffer))
+                span.set_output(output_buffer)
                 span.set_status(Status(StatusCode.OK))
 
     # Return a streaming response
@@ -707,8 +770,6 @@ Do not include the type of task in the name of the task."""
 
     module_concepts = defaultdict(lambda: defaultdict(list))
 
-    output = None
-
     async for chunk in stream:
         if not chunk or not chunk.modules:
             continue
@@ -746,8 +807,6 @@ Do not include the type of task in the name of the task."""
                     task_id = await add_generated_draft_task(course_id, module_id, task)
                     module_concepts[module_id][concept_index].append(task_id)
 
-        # output = chunk
-
     output = chunk.model_dump()
 
     for index, module in enumerate(output["modules"]):
@@ -781,9 +840,7 @@ async def generate_course_structure(
     background_tasks: BackgroundTasks,
     request: GenerateCourseStructureRequest,
 ):
-    openai_client = openai.AsyncOpenAI(
-        api_key=settings.openai_api_key,
-    )
+    openai_client = get_async_openai_client(settings.openai_api_key)
 
     if settings.s3_folder_name:
         reference_material = download_file_from_s3_as_bytes(
@@ -828,6 +885,7 @@ async def generate_course_structure(
     return {"job_uuid": job_uuid}
 
 
+@lru_cache
 def task_generation_schemas():
 
     class BlockProps(BaseModel):
@@ -931,6 +989,13 @@ def task_generation_schemas():
 
 
 def get_system_prompt_for_task_generation(task_type):
+    # the prompt (including the JSON schema) only depends on the task type;
+    # TaskType is not hashable, so key the cache on its string value
+    return _get_system_prompt_for_task_generation(str(task_type))
+
+
+@lru_cache
+def _get_system_prompt_for_task_generation(task_type: str):
     LearningMaterial, Quiz = task_generation_schemas()
     schema = (
         LearningMaterial.model_json_schema()
@@ -1062,11 +1127,7 @@ async def generate_course_tasks(
 ):
     job_details = await get_course_generation_job_details(job_uuid)
 
-    client = instructor.from_openai(
-        openai.AsyncOpenAI(
-            api_key=settings.openai_api_key,
-        )
-    )
+    client = get_instructor_client(settings.openai_api_key)
 
     # Create a list to hold all task coroutines
     tasks = []
@@ -1150,11 +1211,7 @@ async def resume_pending_task_generation_jobs():
 
     tasks = []
 
-    client = instructor.from_openai(
-        openai.AsyncOpenAI(
-            api_key=settings.openai_api_key,
-        )
-    )
+    client = get_instructor_client(settings.openai_api_key)
 
     for job in incomplete_course_jobs:
         tasks.append(
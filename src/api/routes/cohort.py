@@ -1,9 +1,10 @@
+import asyncio
 from collections import defaultdict
 from datetime import datetime
+from statistics import fmean
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Dict
 
-import numpy as np
 from api.db.cohort import (
     get_all_cohorts_for_org as get_all_cohorts_for_org_from_db,
     create_cohort as create_cohort_in_db,
@@ -184,8 +185,11 @@ async def get_leaderboard_data(cohort_id: int):
 
 @router.get("/{cohort_id}/courses/{course_id}/metrics")
 async def get_cohort_metrics_for_course(cohort_id: int, course_id: int):
-    course_data = await get_course_from_db(course_id, only_published=True)
-    cohort_data = await get_cohort_by_id_from_db(cohort_id)
+    # the course and the cohort are independent lookups, so fetch them together
+    course_data, cohort_data = await asyncio.gather(
+        get_course_from_db(course_id, only_published=True),
+        get_cohort_by_id_from_db(cohort_id),
+    )
 
     if not course_data:
         raise HTTPException(status_code=404, detail="Course not found")
@@ -214,12 +218,9 @@ async def get_cohort_metrics_for_course(cohort_id: int, course_id: int):
     if not learner_ids:
         return {}
 
-    task_completions = await get_cohort_completion_from_db(
-        cohort_id, learner_ids, course_id
-    )
-
-    course_attempt_data = await get_cohort_course_attempt_data_from_db(
-        learner_ids, course_id
+    task_completions, course_attempt_data = await asyncio.gather(
+        get_cohort_completion_from_db(cohort_id, learner_ids, course_id),
+        get_cohort_course_attempt_data_from_db(learner_ids, course_id),
     )
 
     num_tasks = len(task_completions[learner_ids[0]])
@@ -230,7 +231,7 @@ async def get_cohort_metrics_for_course(cohort_id: int, course_id: int):
     task_type_completions = defaultdict(lambda: defaultdict(int))
     task_type_completion_rates = defaultdict(list)
 
-    user_data = defaultdict(lambda: defaultdict(int))
+    completion_rates = []
 
     for learner_id in learner_ids:
         num_tasks_completed = 0
@@ -245,8 +246,7 @@ async def get_cohort_metrics_for_course(cohort_id: int, course_id: int):
                     learner_id
                 ] += 1
 
-        user_data[learner_id]["completed"] = num_tasks_completed
-        user_data[learner_id]["completion_percentage"] = num_tasks_completed / num_tasks
+        completion_rates.append(num_tasks_completed / num_tasks)
 
         for task_type in task_type_counts.keys():
             task_type_completion_rates[task_type].append(
@@ -260,18 +260,13 @@ async def get_cohort_metrics_for_course(cohort_id: int, course_id: int):
     }
 
     return {
-        "average_completion": np.mean(
-            [
-                user_data[learner_id]["completion_percentage"]
-                for learner_id in learner_ids
-            ]
-        ),
+        "average_completion": fmean(completion_rates),
         "num_tasks": num_tasks,
         "num_active_learners": sum(is_learner_active.values()),
         "task_type_metrics": {
             task_type: {
                 "completion_rate": (
-                    np.mean(task_type_completion_rates[task_type])
+                    fmean(task_type_completion_rates[task_type])
                     if task_type in task_type_completion_rates
                     else 0
                 ),
@@ -5,15 +5,17 @@ Accepts a session's raw proctoring events and returns a mentor-facing
 LLM-generated report. Uses the globally configured OpenAI API key.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from api.settings import settings
 from api.config import openai_plan_to_model_name
-import openai
+from api.llm import get_async_openai_client
+from api.utils.logging import logger
 
 
 router = APIRouter()
@@ -110,11 +112,7 @@ def _build_system_prompt() -> str:
     )
 
 
-@router.post("/report")
-async def generate_integrity_report(request: GenerateReportRequest) -> Dict[str, str]:
-    if not settings.openai_api_key:
-        raise HTTPException(status_code=500, detail="OpenAI API key is not configured on the server")
-
+def _build_report_messages(request: GenerateReportRequest) -> List[Dict[str, str]]:
     aggregates = _summarize_events(request.events)
 
     # Build user-visible content compactly to reduce token usage
@@ -131,23 +129,35 @@ async def generate_integrity_report(request: GenerateReportRequest) -> Dict[str,
         "timeline": aggregates["timeline"][:400],  # cap to keep prompt bounded
     }
 
-    model = openai_plan_to_model_name.get("text-mini") or "gpt-4.1-mini"
-    client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
+    return [
+        {"role": "system", "content": _build_system_prompt()},
+        {
+            "role": "user",
+            "content": (
+                "Generate a mentor-facing integrity report based on this JSON input.\n"
+                "JSON:\n" + str(user_prompt)
+            ),
+        },
+    ]
+
+
+def _get_report_model() -> str:
+    return openai_plan_to_model_name.get("text-mini") or "gpt-4.1-mini"
+
+
+@router.post("/report")
+async def generate_integrity_report(request: GenerateReportRequest) -> Dict[str, str]:
+    if not settings.openai_api_key:
+        raise HTTPException(status_code=500, detail="OpenAI API key is not configured on the server")
+
+    messages = _build_report_messages(request)
+    client = get_async_openai_client(settings.openai_api_key)
 
     try:
         completion = await client.chat.completions.create(
-            model=model,
+            model=_get_report_model(),
             temperature=0.2,
-            messages=[
-                {"role": "system", "content": _build_system_prompt()},
-                {
-                    "role": "user",
-                    "content": (
-                        "Generate a mentor-facing integrity report based on this JSON input.\n"
-                        "JSON:\n" + str(user_prompt)
-                    ),
-                },
-            ],
+            messages=messages,
         )
         content = completion.choices[0].message.content or ""
         return {"report": content}
@@ -155,3 +165,39 @@ async def generate_integrity_report(request: GenerateReportRequest) -> Dict[str,
         raise HTTPException(status_code=500, detail=f"Failed to generate report: {str(e)}")
 
 
+# Written as the last line of a streamed report that failed part way through,
+# since the 200 status has already been sent by then
+REPORT_STREAM_ERROR_MARKER = "[ERROR]"
+
+
+@router.post("/report/stream")
+async def stream_integrity_report(request: GenerateReportRequest) -> StreamingResponse:
+    """Same report as /report, streamed as plain text so the UI can render it as it is generated."""
+    if not settings.openai_api_key:
+        raise HTTPException(status_code=500, detail="OpenAI API key is not configured on the server")
+
+    messages = _build_report_messages(request)
+    client = get_async_openai_client(settings.openai_api_key)
+
+    try:
+        stream = await client.chat.completions.create(
+            model=_get_report_model(),
+            temperature=0.2,
+            messages=messages,
+            stream=True,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to generate report: {str(e)}")
+
+    async def stream_report() -> AsyncGenerator[str, None]:
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logger.error(f"Integrity report stream failed: {str(e)}")
+            yield f"\n\n{REPORT_STREAM_ERROR_MARKER} Failed to generate report: {str(e)}\n"
+
+    return StreamingResponse(stream_report(), media_type="text/plain")
+
+
@@ -1,6 +1,8 @@
-from typing import Dict, List
+from typing import Coroutine, Dict, List
+import asyncio
 import aiohttp
 from api.settings import settings
+from api.utils.logging import logger
 
 
 async def send_slack_notification(message: Dict, webhook_url: str):
@@ -13,6 +15,37 @@ async def send_slack_notification(message: Dict, webhook_url: str):
                 )
 
 
+async def send_slack_notifications(
+    notifications: List[Coroutine], max_concurrency: int = 5
+):
+    """
+    Send a batch of Slack notifications on a best-effort basis.
+
+    The notifications describe changes that have already been committed, so a
+    failure to deliver one is logged instead of being raised to the caller.
+    Only a few are in flight at once so that a bulk add does not get rate
+    limited by the webhook.
+
+    Args:
+        notifications: Coroutines that each send one notification
+        max_concurrency: Maximum number of notifications sent at the same time
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def send(notification: Coroutine):
+        async with semaphore:
+            await notification
+
+    results = await asyncio.gather(
+        *[send(notification) for notification in notifications],
+        return_exceptions=True,
+    )
+
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Failed to send Slack notification: {result}")
+
+
 async def send_slack_notification_for_new_user(user: Dict):
     """
     Send Slack notification when a new user is created.
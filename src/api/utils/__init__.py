@@ -13,9 +13,8 @@ def generate_random_color() -> str:
     color = colorsys.hsv_to_rgb(hue, saturation, value)
 
     # Convert RGB values to hex
-    return "#{:02x}{:02x}{:02x}".format(
-        int(color[0] * 255), int(color[1] * 255), int(color[2] * 255)
-    )
+    red, green, blue = (int(channel * 255) for channel in color)
+    return f"#{red:02x}{green:02x}{blue:02x}"
 
 
 def get_date_from_str(date_str: str, source_timezone: str) -> datetime.date:
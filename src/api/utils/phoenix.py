@@ -55,36 +55,44 @@ def get_raw_traces(
     )
 
 
+def _build_last_entries_df(
+    df: pd.DataFrame, labels: list, chat_histories: list, contexts: list
+) -> pd.DataFrame:
+    # The rows of df at the given labels, with their chat history and context added
+    result = df.loc[labels].copy()
+    result["chat_history"] = pd.Series(chat_histories, index=result.index, dtype=object)
+    result["context"] = pd.Series(contexts, index=result.index, dtype=object)
+    return result
+
+
 def prepare_feedback_traces_for_annotation(df: pd.DataFrame) -> pd.DataFrame:
     # Filter out feedback stage entries
     df_non_root = df[~df["attributes.metadata"].isna()].reset_index(drop=True)
+    if df_non_root.empty:
+        return pd.DataFrame()
+
     df_feedback = df_non_root[
-        df_non_root["attributes.metadata"].apply(lambda x: x["stage"] == "feedback")
+        df_non_root["attributes.metadata"].str.get("stage") == "feedback"
     ].reset_index(drop=True)
 
     # Function to get the last entry for each group and build chat history
     def get_last_entries_with_chat_history(df):
         # Separate learning_material and quiz types
-        df_lm = df[
-            df["attributes.metadata"].apply(
-                lambda x: x.get("type") == "learning_material"
-            )
-        ]
-        df_quiz = df[df["attributes.metadata"].apply(lambda x: x.get("type") == "quiz")]
+        task_types = df["attributes.metadata"].str.get("type")
+        df_lm = df[task_types == "learning_material"]
+        df_quiz = df[task_types == "quiz"]
 
         result_dfs = []
 
         # For learning_material: group by task_id and user_id
         if not df_lm.empty:
-            df_lm_copy = df_lm.copy()
-            df_lm_copy["task_id"] = df_lm_copy["attributes.metadata"].apply(
-                lambda x: x.get("task_id")
+            grouped_lm = df_lm.groupby(
+                [df_lm["attributes.metadata"].str.get("task_id"), "attributes.user.id"]
             )
 
-            # Group and process each group
-            grouped_lm = df_lm_copy.groupby(["task_id", "attributes.user.id"])
-
-            processed_rows = []
+            last_entry_labels = []
+            chat_histories = []
+            contexts = []
             for (task_id, user_id), group in grouped_lm:
                 # Sort by start_time to ensure chronological order
                 group_sorted = group.sort_values("start_time")
@@ -92,10 +100,11 @@ def prepare_feedback_traces_for_annotation(df: pd.DataFrame) -> pd.DataFrame:
                 # Build chat history from all entries in the group
                 chat_history = []
                 context = None
-                for _, row in group_sorted.iterrows():
+                for input_messages, output_messages in zip(
+                    group_sorted["attributes.llm.input_messages"],
+                    group_sorted["attributes.llm.output_messages"],
+                ):
                     try:
-                        input_messages = row["attributes.llm.input_messages"]
-                        output_messages = row["attributes.llm.output_messages"]
 
                         # Find the second last user message (the actual user query)
                         user_messages = [
@@ -136,25 +145,29 @@ def prepare_feedback_traces_for_annotation(df: pd.DataFrame) -> pd.DataFrame:
                     continue
 
                 # Take the last entry and add chat history
-                last_entry = group_sorted.iloc[-1].copy()
-                last_entry["chat_history"] = chat_history
-                last_entry["context"] = context
-                processed_rows.append(last_entry)
-
-            if processed_rows:
-                df_lm_result = pd.DataFrame(processed_rows).drop(["task_id"], axis=1)
-                result_dfs.append(df_lm_result)
+                last_entry_labels.append(group_sorted.index[-1])
+                chat_histories.append(chat_history)
+                contexts.append(context)
+
+            if last_entry_labels:
+                result_dfs.append(
+                    _build_last_entries_df(
+                        df_lm, last_entry_labels, chat_histories, contexts
+                    )
+                )
 
         # For quiz: group by question_id and user_id
         if not df_quiz.empty:
-            df_quiz_copy = df_quiz.copy()
-            df_quiz_copy["question_id"] = df_quiz_copy["attributes.metadata"].apply(
-                lambda x: x.get("question_id")
+            grouped_quiz = df_quiz.groupby(
+                [
+                    df_quiz["attributes.metadata"].str.get("question_id"),
+                    "attributes.user.id",
+                ]
             )
-            # Group and process each group
-            grouped_quiz = df_quiz_copy.groupby(["question_id", "attributes.user.id"])
 
-            processed_rows = []
+            last_entry_labels = []
+            chat_histories = []
+            contexts = []
             for (question_id, user_id), group in grouped_quiz:
                 # Sort by start_time to ensure chronological order
                 group_sorted = group.sort_values("start_time")
@@ -162,17 +175,16 @@ def prepare_feedback_traces_for_annotation(df: pd.DataFrame) -> pd.DataFrame:
                 # Build chat history from all entries in the group
                 chat_history = []
                 context = None
-                for _, row in group_sorted.iterrows():
+                for input_messages, output_messages in zip(
+                    group_sorted["attributes.llm.input_messages"],
+                    group_sorted["attributes.llm.output_messages"],
+                ):
                     try:
-                        input_messages = row["attributes.llm.input_messages"]
-
-                        if isinstance(
-                            row["attributes.llm.output_messages"], float
-                        ) and math.isnan(row["attributes.llm.output_messages"]):
+                        if isinstance(output_messages, float) and math.isnan(
+                            output_messages
+                        ):
                             continue
 
-                        output_messages = row["attributes.llm.output_messages"]
-
                         # Find the second last user message (the actual user query)
                         user_messages = [
                             msg
@@ -219,16 +231,16 @@ def prepare_feedback_traces_for_annotation(df: pd.DataFrame) -> pd.DataFrame:
                     continue
 
                 # Take the last entry and add chat history
-                last_entry = group_sorted.iloc[-1].copy()
-                last_entry["chat_history"] = chat_history
-                last_entry["context"] = context
-                processed_rows.append(last_entry)
-
-            if processed_rows:
-                df_quiz_result = pd.DataFrame(processed_rows).drop(
-                    ["question_id"], axis=1
+                last_entry_labels.append(group_sorted.index[-1])
+                chat_histories.append(chat_history)
+                contexts.append(context)
+
+            if last_entry_labels:
+                result_dfs.append(
+                    _build_last_entries_df(
+                        df_quiz, last_entry_labels, chat_histories, contexts
+                    )
                 )
-                result_dfs.append(df_quiz_result)
 
         # Combine all results
         if result_dfs:
@@ -319,9 +331,16 @@ def save_daily_traces():
 
     feedback_traces_for_annotation_df = prepare_feedback_traces_for_annotation(df)
 
-    feedback_conversations = feedback_traces_for_annotation_df.apply(
-        convert_feedback_span_to_conversations, axis=1
-    ).values.tolist()
+    feedback_conversations = [
+        convert_feedback_span_to_conversations(row)
+        for row in feedback_traces_for_annotation_df.to_dict("records")
+    ]
+
+    if not feedback_conversations:
+        # nothing to merge, so skip downloading, backing up and re-uploading
+        # the conversations file
+        print("No feedback conversations to upload", flush=True)
+        return
 
     s3_key = f"{settings.s3_folder_name}/evals/conversations.json"
 
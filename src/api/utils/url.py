@@ -1,7 +1,7 @@
-import streamlit as st
 import re
 import os
 from typing import Dict
+from urllib.parse import urlencode
 from unidecode import unidecode
 
 
@@ -33,7 +33,7 @@ def get_home_url(params: Dict[str, str] = None) -> str:
     home_page_url = os.environ.get("APP_URL")
 
     if params:
-        query_params = "&".join([f"{key}={value}" for key, value in params.items()])
-        home_page_url += f"?{query_params}"
+        # urlencode escapes values such as emails containing "+" or "@"
+        home_page_url += f"?{urlencode(params)}"
 
     return home_page_url
@@ -20,21 +20,18 @@ class TestStoreMessages:
     """Test message storage functionality."""
 
     @patch("src.api.db.chat.get_new_db_connection")
-    @patch("src.api.db.chat.execute_db_operation")
-    async def test_store_messages_success(self, mock_execute, mock_get_conn):
+    async def test_store_messages_success(self, mock_get_conn):
         """Test successful message storage."""
         mock_cursor = AsyncMock()
-        mock_cursor.lastrowid = 123
+        # Rows returned by the INSERT ... RETURNING statement
+        mock_cursor.fetchall.return_value = [
+            (123, "2024-01-01 12:00:00", 1, 1, "user", "Hello", "text")
+        ]
         mock_conn = AsyncMock()
         mock_conn.cursor.return_value = mock_cursor
         mock_conn.__aenter__.return_value = mock_conn
         mock_get_conn.return_value = mock_conn
 
-        # Mock the fetch result
-        mock_execute.return_value = [
-            (123, "2024-01-01 12:00:00", 1, 1, "user", "Hello", "text")
-        ]
-
         messages = [
             StoreMessageRequest(
                 role="user",
@@ -49,24 +46,22 @@ class TestStoreMessages:
         assert len(result) == 1
         assert result[0]["id"] == 123
         assert result[0]["content"] == "Hello"
-        mock_cursor.execute.assert_called()
+        mock_cursor.execute.assert_called_once()
+        assert "RETURNING" in mock_cursor.execute.call_args[0][0]
         mock_conn.commit.assert_called_once()
 
     @patch("src.api.db.chat.get_new_db_connection")
-    @patch("src.api.db.chat.execute_db_operation")
-    async def test_store_messages_with_completion(self, mock_execute, mock_get_conn):
+    async def test_store_messages_with_completion(self, mock_get_conn):
         """Test message storage with task completion."""
         mock_cursor = AsyncMock()
-        mock_cursor.lastrowid = 123
+        mock_cursor.fetchall.return_value = [
+            (123, "2024-01-01 12:00:00", 1, 1, "user", "Hello", "text")
+        ]
         mock_conn = AsyncMock()
         mock_conn.cursor.return_value = mock_cursor
         mock_conn.__aenter__.return_value = mock_conn
         mock_get_conn.return_value = mock_conn
 
-        mock_execute.return_value = [
-            (123, "2024-01-01 12:00:00", 1, 1, "user", "Hello", "text")
-        ]
-
         messages = [
             StoreMessageRequest(
                 role="user",
@@ -81,45 +76,75 @@ class TestStoreMessages:
         # Should insert completion record
         assert (
             mock_cursor.execute.call_count == 2
-        )  # One for message, one for completion
+        )  # One for the messages, one for completion
         calls = [call[0][0] for call in mock_cursor.execute.call_args_list]
         assert any("task_completions" in call for call in calls)
 
     @patch("src.api.db.chat.get_new_db_connection")
-    @patch("src.api.db.chat.execute_db_operation")
-    async def test_store_multiple_messages(self, mock_execute, mock_get_conn):
+    async def test_store_multiple_messages(self, mock_get_conn):
         """Test storing multiple messages."""
         mock_cursor = AsyncMock()
-        mock_cursor.lastrowid = 123
+        # RETURNING does not guarantee the order of the rows
+        mock_cursor.fetchall.return_value = [
+            (124, "2024-01-01 12:01:00", 1, 1, "assistant", "Hi", "text"),
+            (123, "2024-01-01 12:00:00", 1, 1, "user", "Hello", "text"),
+        ]
         mock_conn = AsyncMock()
         mock_conn.cursor.return_value = mock_cursor
         mock_conn.__aenter__.return_value = mock_conn
         mock_get_conn.return_value = mock_conn
 
-        mock_execute.return_value = [
-            (123, "2024-01-01 12:00:00", 1, 1, "user", "Hello", "text"),
-            (124, "2024-01-01 12:01:00", 1, 1, "assistant", "Hi", "text"),
-        ]
-
+        created_at = datetime.now()
         messages = [
             StoreMessageRequest(
                 role="user",
                 content="Hello",
                 response_type="text",
-                created_at=datetime.now(),
+                created_at=created_at,
             ),
             StoreMessageRequest(
                 role="assistant",
                 content="Hi",
                 response_type="text",
-                created_at=datetime.now(),
+                created_at=created_at,
             ),
         ]
 
         result = await store_messages(messages, 1, 1, False)
 
         assert len(result) == 2
-        assert mock_cursor.execute.call_count == 2  # One for each message
+        assert [message["id"] for message in result] == [123, 124]
+
+        # Both messages are inserted with a single statement
+        mock_cursor.execute.assert_called_once()
+        assert mock_cursor.execute.call_args[0][1] == (
+            1,
+            1,
+            "user",
+            "Hello",
+            "text",
+            created_at,
+            1,
+            1,
+            "assistant",
+            "Hi",
+            "text",
+            created_at,
+        )
+
+    @patch("src.api.db.chat.get_new_db_connection")
+    async def test_store_messages_empty(self, mock_get_conn):
+        """Test that no insert is issued when there are no messages."""
+        mock_cursor = AsyncMock()
+        mock_conn = AsyncMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_conn.__aenter__.return_value = mock_conn
+        mock_get_conn.return_value = mock_conn
+
+        result = await store_messages([], 1, 1, False)
+
+        assert result == []
+        mock_cursor.execute.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -26,6 +26,7 @@ class TestCodeDraftOperations:
         ON CONFLICT(user_id, question_id) DO UPDATE SET
             code = excluded.code,
             updated_at = CURRENT_TIMESTAMP
+        WHERE code IS NOT excluded.code
         """,
             (1, 1, json.dumps(code_data)),
         )
@@ -44,6 +45,7 @@ class TestCodeDraftOperations:
         ON CONFLICT(user_id, question_id) DO UPDATE SET
             code = excluded.code,
             updated_at = CURRENT_TIMESTAMP
+        WHERE code IS NOT excluded.code
         """,
             (1, 1, json.dumps(code_data)),
         )
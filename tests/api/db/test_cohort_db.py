@@ -251,6 +251,12 @@ class TestCohortMemberOperations:
         ]
         mock_insert_user.side_effect = mock_users
 
+        # Record whether the members were committed when each notification is sent
+        committed_when_notified = []
+        mock_slack.side_effect = lambda *args: committed_when_notified.append(
+            mock_conn.commit.called
+        )
+
         emails = ["user1@example.com", "user2@example.com"]
         roles = ["learner", "mentor"]
 
@@ -258,8 +264,39 @@ class TestCohortMemberOperations:
 
         # Verify user creation calls
         assert mock_insert_user.call_count == 2
-        # Verify Slack notifications
+        # Verify Slack notifications are only sent once the members are committed
         assert mock_slack.call_count == 2
+        assert committed_when_notified == [True, True]
+
+    @patch("src.api.db.cohort.execute_db_operation")
+    @patch("src.api.db.cohort.get_new_db_connection")
+    @patch("src.api.db.cohort.insert_or_return_user")
+    @patch("src.api.db.cohort.send_slack_notification_for_learner_added_to_cohort")
+    async def test_add_members_to_cohort_slack_failure(
+        self, mock_slack, mock_insert_user, mock_connection, mock_execute
+    ):
+        """Test that a Slack failure does not fail an already committed add."""
+        mock_cursor = AsyncMock()
+        mock_cursor.fetchone.return_value = None  # No existing users
+        mock_conn = AsyncMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connection.return_value.__aenter__.return_value = mock_conn
+
+        mock_execute.side_effect = [
+            (1,),  # Get org_id from slug
+            ("Test Cohort",),  # Cohort exists in organization
+            [],  # No admin emails
+        ]
+
+        mock_insert_user.return_value = {"id": 1, "email": "user@example.com"}
+        mock_slack.side_effect = Exception("Slack is down")
+
+        await add_members_to_cohort(
+            1, "test-org", None, ["user@example.com"], ["learner"]
+        )
+
+        mock_conn.commit.assert_called_once()
+        mock_slack.assert_called_once()
 
     @patch("src.api.db.cohort.execute_db_operation")
     async def test_add_members_to_cohort_org_not_found_by_slug(self, mock_execute):
@@ -307,8 +344,9 @@ class TestCohortMemberOperations:
     @patch("src.api.db.cohort.execute_db_operation")
     @patch("src.api.db.cohort.get_new_db_connection")
     @patch("src.api.db.cohort.insert_or_return_user")
+    @patch("src.api.db.cohort.send_slack_notification_for_learner_added_to_cohort")
     async def test_add_members_to_cohort_user_already_exists(
-        self, mock_insert_user, mock_connection, mock_execute
+        self, mock_slack, mock_insert_user, mock_connection, mock_execute
     ):
         """Test adding user that already exists in cohort."""
         # Mock database setup
@@ -329,6 +367,9 @@ class TestCohortMemberOperations:
         with pytest.raises(Exception, match="User already exists in cohort"):
             await add_members_to_cohort(1, None, 1, ["user@example.com"], ["learner"])
 
+        # No notification is sent for members that were not added
+        mock_slack.assert_not_called()
+
     async def test_add_members_to_cohort_both_org_params_none(self):
         """Test adding members when both org_slug and org_id are None."""
         with pytest.raises(
@@ -376,7 +376,7 @@ class TestMilestoneOperations:
         mock_get_org.return_value = 1
         mock_cursor = AsyncMock()
         mock_cursor.lastrowid = 123
-        mock_cursor.fetchone.return_value = (5,)  # max ordering
+        mock_cursor.fetchone.return_value = (6,)  # ordering returned by the insert
         mock_conn = AsyncMock()
         mock_conn.cursor.return_value = mock_cursor
         mock_connection.return_value.__aenter__.return_value = mock_conn
@@ -387,6 +387,10 @@ class TestMilestoneOperations:
 
         assert milestone_id == 123
         assert ordering == 6
+        # milestone insert + course milestone insert with its ordering
+        assert mock_cursor.execute.call_count == 2
+        assert mock_cursor.execute.call_args[0][1] == (1, 123, 1)
+        mock_conn.commit.assert_called_once()
 
     @patch("src.api.db.course.execute_many_db_operation")
     async def test_update_milestone_orders(self, mock_execute_many):
@@ -1083,10 +1087,11 @@ class TestUserCourses:
         """Test getting user courses with multiple roles."""
         # Mock database connection
         mock_cursor = AsyncMock()
-        mock_cursor.fetchone.side_effect = [
+        # Rows come back from a single query, in no particular order
+        mock_cursor.fetchall.return_value = [
+            (3, "Course 3", 2, "Org 2", "org-2"),
             (1, "Course 1", 1, "Org 1", "org-1"),
             (2, "Course 2", 1, "Org 1", "org-1"),
-            (3, "Course 3", 2, "Org 2", "org-2"),
         ]
         mock_conn = AsyncMock()
         mock_conn.cursor.return_value = mock_cursor
@@ -1117,10 +1122,14 @@ class TestUserCourses:
         result = await get_user_courses(123)
 
         assert len(result) == 3
+        assert [course["id"] for course in result] == [1, 2, 3]
         assert result[0]["role"] == "learner"
         assert result[1]["role"] == "mentor"
         assert result[2]["role"] == "admin"
 
+        mock_cursor.execute.assert_called_once()
+        assert mock_cursor.execute.call_args[0][1] == [1, 2, 3]
+
     @patch("src.api.db.course.get_new_db_connection")
     @patch("src.api.db.course.get_user_cohorts")
     @patch("src.api.db.course.get_user_organizations")
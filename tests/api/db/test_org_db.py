@@ -13,7 +13,6 @@ from src.api.db.org import (
     create_org_api_key,
     get_org_id_from_api_key,
     get_hva_org_id,
-    get_hva_cohort_ids,
     is_user_hva_learner,
     get_hva_openai_api_key,
     add_users_to_org_by_email,
@@ -283,54 +282,21 @@ class TestOrganizationOperations:
 
         assert result is None
 
-    @patch("src.api.db.org.get_hva_org_id")
-    @patch("src.api.db.org.execute_db_operation")
-    async def test_get_hva_cohort_ids_success(self, mock_execute, mock_get_hva_org):
-        """Test successful HVA cohort IDs retrieval."""
-        mock_get_hva_org.return_value = 456
-        mock_execute.return_value = [(1,), (2,), (3,)]
-
-        result = await get_hva_cohort_ids()
-
-        assert result == [1, 2, 3]
-        mock_execute.assert_called_once_with(
-            "SELECT id FROM cohorts WHERE org_id = ?", (456,), fetch_all=True
-        )
-
-    @patch("src.api.db.org.get_hva_org_id")
-    async def test_get_hva_cohort_ids_no_org(self, mock_get_hva_org):
-        """Test HVA cohort IDs when org doesn't exist."""
-        mock_get_hva_org.return_value = None
-
-        result = await get_hva_cohort_ids()
-
-        assert result == []
-
-    @patch("src.api.db.org.get_hva_cohort_ids")
     @patch("src.api.db.org.execute_db_operation")
-    async def test_is_user_hva_learner_true(self, mock_execute, mock_get_cohorts):
+    async def test_is_user_hva_learner_true(self, mock_execute):
         """Test user is HVA learner."""
-        mock_get_cohorts.return_value = [1, 2, 3]
         mock_execute.return_value = (1,)
 
         result = await is_user_hva_learner(123)
 
         assert result is True
+        # A single query resolves the org, its cohorts and the membership
+        mock_execute.assert_called_once()
+        assert mock_execute.call_args[0][1] == (123, "HyperVerge Academy")
 
-    @patch("src.api.db.org.get_hva_cohort_ids")
-    async def test_is_user_hva_learner_no_cohorts(self, mock_get_cohorts):
-        """Test user HVA learner check when no cohorts exist."""
-        mock_get_cohorts.return_value = []
-
-        result = await is_user_hva_learner(123)
-
-        assert result is False
-
-    @patch("src.api.db.org.get_hva_cohort_ids")
     @patch("src.api.db.org.execute_db_operation")
-    async def test_is_user_hva_learner_false(self, mock_execute, mock_get_cohorts):
+    async def test_is_user_hva_learner_false(self, mock_execute):
         """Test user is not HVA learner."""
-        mock_get_cohorts.return_value = [1, 2, 3]
         mock_execute.return_value = (0,)
 
         result = await is_user_hva_learner(123)
@@ -370,11 +336,18 @@ class TestOrganizationOperations:
         mock_user2 = {"id": 2, "email": "user2@example.com"}
         mock_insert_user.side_effect = [mock_user1, mock_user2]
 
+        # Record whether the users were committed when each notification is sent
+        committed_when_notified = []
+        mock_slack.side_effect = lambda *args: committed_when_notified.append(
+            mock_conn_instance.commit.called
+        )
+
         await add_users_to_org_by_email(1, ["user1@example.com", "user2@example.com"])
 
         assert mock_insert_user.call_count == 2
         mock_cursor.executemany.assert_called_once()
         mock_conn_instance.commit.assert_called_once()
+        assert committed_when_notified == [True, True]
 
     @patch("src.api.db.org.get_org_by_id")
     async def test_add_users_to_org_by_email_org_not_found(self, mock_get_org):
@@ -387,8 +360,9 @@ class TestOrganizationOperations:
     @patch("src.api.db.org.get_org_by_id")
     @patch("src.api.db.org.get_new_db_connection")
     @patch("src.api.db.org.insert_or_return_user")
+    @patch("src.api.db.org.send_slack_notification_for_member_added_to_org")
     async def test_add_users_to_org_by_email_existing_users(
-        self, mock_insert_user, mock_db_conn, mock_get_org
+        self, mock_slack, mock_insert_user, mock_db_conn, mock_get_org
     ):
         """Test adding users that already exist in org."""
         mock_get_org.return_value = {"id": 1, "slug": "test-org", "name": "Test Org"}
@@ -406,6 +380,9 @@ class TestOrganizationOperations:
         with pytest.raises(Exception, match="Some users already exist in organization"):
             await add_users_to_org_by_email(1, ["user@example.com"])
 
+        # No notification is sent for members that were not added
+        mock_slack.assert_not_called()
+
     @patch("src.api.db.org.execute_db_operation")
     async def test_remove_members_from_org(self, mock_execute):
         """Test removing members from org."""
@@ -596,21 +596,29 @@ class TestTaskOperations:
             (123, 1),
         )
 
-    @patch("src.api.db.task.execute_db_operation")
+    @patch("src.api.db.task.execute_multiple_db_operations")
     async def test_delete_completion_history_for_task_with_task_id(self, mock_execute):
         """Test deleting completion history with task ID."""
         await delete_completion_history_for_task(1, 123, 456)
 
-        assert mock_execute.call_count == 2
+        # Both deletes run in a single transaction
+        mock_execute.assert_called_once()
+        commands_and_params = mock_execute.call_args[0][0]
+        assert len(commands_and_params) == 2
+        assert commands_and_params[0][1] == (1, 456)
+        assert commands_and_params[1][1] == (123, 456)
 
-    @patch("src.api.db.task.execute_db_operation")
+    @patch("src.api.db.task.execute_multiple_db_operations")
     async def test_delete_completion_history_for_task_without_task_id(
         self, mock_execute
     ):
         """Test deleting completion history without task ID."""
         await delete_completion_history_for_task(None, 123, 456)
 
-        assert mock_execute.call_count == 1
+        mock_execute.assert_called_once()
+        commands_and_params = mock_execute.call_args[0][0]
+        assert len(commands_and_params) == 1
+        assert commands_and_params[0][1] == (123, 456)
 
     @patch("src.api.db.task.get_new_db_connection")
     async def test_schedule_module_tasks(self, mock_db_conn):
@@ -625,7 +633,11 @@ class TestTaskOperations:
         scheduled_at = datetime.now()
         await schedule_module_tasks(1, 2, scheduled_at)
 
-        assert mock_cursor.execute.call_count >= 2  # At least select and update calls
+        # One select and a single update for all the tasks in the module
+        assert mock_cursor.execute.call_count == 2
+        update_call = mock_cursor.execute.call_args_list[1]
+        assert "WHERE id IN (?,?)" in update_call[0][0]
+        assert update_call[0][1] == (scheduled_at, 1, 2)
         mock_conn_instance.commit.assert_called_once()
 
     @patch("src.api.db.task.get_new_db_connection")
@@ -0,0 +1,88 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import patch, call
+from fastapi.responses import StreamingResponse
+from src.api.routes.ai import (
+    ai_response_for_question,
+    get_user_audio_messages_for_chat_history,
+)
+from api.models import (
+    AIChatRequest,
+    ChatResponseType,
+    QuestionType,
+    TaskType,
+)
+
+
+@pytest.mark.asyncio
+class TestGetUserAudioMessagesForChatHistory:
+    """Test loading audio responses for the chat history."""
+
+    @patch("src.api.routes.ai.asyncio.to_thread", wraps=asyncio.to_thread)
+    @patch("src.api.routes.ai.get_user_audio_message_for_chat_history")
+    async def test_audio_is_loaded_in_worker_threads(self, mock_loader, mock_to_thread):
+        """Test that every audio file is loaded through asyncio.to_thread in order."""
+        mock_loader.side_effect = lambda uuid: [{"type": "text", "text": uuid}]
+
+        result = await get_user_audio_messages_for_chat_history(["uuid-1", "uuid-2"])
+
+        assert result == [
+            [{"type": "text", "text": "uuid-1"}],
+            [{"type": "text", "text": "uuid-2"}],
+        ]
+        assert mock_to_thread.call_args_list == [
+            call(mock_loader, "uuid-1"),
+            call(mock_loader, "uuid-2"),
+        ]
+
+
+@pytest.mark.asyncio
+class TestAIChatAudio:
+    """Test audio handling in the /chat endpoint."""
+
+    @patch("src.api.routes.ai.asyncio.to_thread", wraps=asyncio.to_thread)
+    @patch("src.api.routes.ai.get_user_audio_message_for_chat_history")
+    @patch("src.api.routes.ai.get_task_metadata")
+    @patch("src.api.routes.ai.get_question_chat_history_for_user")
+    @patch("src.api.routes.ai.get_question")
+    async def test_current_audio_response_is_loaded_in_worker_thread(
+        self,
+        mock_get_question,
+        mock_get_chat_history,
+        mock_get_task_metadata,
+        mock_loader,
+        mock_to_thread,
+    ):
+        """Test that the current audio response is loaded off the event loop with the past ones."""
+        mock_get_question.return_value = {
+            "type": QuestionType.OBJECTIVE,
+            "response_type": "chat",
+            "input_type": "audio",
+            "context": None,
+            "blocks": [],
+            "answer": [],
+        }
+        mock_get_chat_history.return_value = [
+            {"role": "user", "content": "past-uuid"},
+            {"role": "assistant", "content": json.dumps({"feedback": "Good try"})},
+        ]
+        mock_get_task_metadata.return_value = None
+        mock_loader.side_effect = lambda uuid: [{"type": "text", "text": uuid}]
+
+        request = AIChatRequest(
+            user_response="current-uuid",
+            task_type=TaskType.QUIZ,
+            question_id=1,
+            user_id=1,
+            task_id=1,
+            response_type=ChatResponseType.AUDIO,
+        )
+
+        response = await ai_response_for_question(request)
+
+        assert isinstance(response, StreamingResponse)
+        assert mock_to_thread.call_args_list == [
+            call(mock_loader, "past-uuid"),
+            call(mock_loader, "current-uuid"),
+        ]
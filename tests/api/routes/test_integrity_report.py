@@ -0,0 +1,141 @@
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+from fastapi.testclient import TestClient
+from src.api.routes.integrity_report import router, REPORT_STREAM_ERROR_MARKER
+from fastapi import FastAPI
+
+# Create a test app with the integrity report router
+app = FastAPI()
+app.include_router(router, prefix="/api/integrity")
+client = TestClient(app)
+
+request_data = {
+    "session_uuid": "session-123",
+    "user_id": 1,
+    "events": [
+        {
+            "type": "tab_switch",
+            "severity": "high",
+            "timestamp": "2024-01-01T12:00:00Z",
+            "flagged": True,
+        }
+    ],
+}
+
+
+def make_chunk(content):
+    chunk = MagicMock()
+    chunk.choices = [MagicMock()]
+    chunk.choices[0].delta.content = content
+    return chunk
+
+
+def make_stream(contents, error=None):
+    async def stream():
+        for content in contents:
+            yield make_chunk(content)
+
+        if error:
+            raise error
+
+    return stream()
+
+
+class TestIntegrityReportRoutes:
+    """Test integrity report route endpoints."""
+
+    @patch("src.api.routes.integrity_report.settings")
+    def test_generate_report_no_api_key(self, mock_settings):
+        """Test report generation when the OpenAI API key is not configured."""
+        mock_settings.openai_api_key = None
+
+        response = client.post("/api/integrity/report", json=request_data)
+
+        assert response.status_code == 500
+        assert response.json() == {
+            "detail": "OpenAI API key is not configured on the server"
+        }
+
+    @patch("src.api.routes.integrity_report.get_async_openai_client")
+    @patch("src.api.routes.integrity_report.settings")
+    def test_generate_report_success(self, mock_settings, mock_get_client):
+        """Test successful report generation."""
+        mock_settings.openai_api_key = "test_key"
+        mock_client = MagicMock()
+        mock_completion = MagicMock()
+        mock_completion.choices[0].message.content = "# Report"
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_completion)
+        mock_get_client.return_value = mock_client
+
+        response = client.post("/api/integrity/report", json=request_data)
+
+        assert response.status_code == 200
+        assert response.json() == {"report": "# Report"}
+        mock_get_client.assert_called_once_with("test_key")
+
+    @patch("src.api.routes.integrity_report.settings")
+    def test_stream_report_no_api_key(self, mock_settings):
+        """Test report streaming when the OpenAI API key is not configured."""
+        mock_settings.openai_api_key = None
+
+        response = client.post("/api/integrity/report/stream", json=request_data)
+
+        assert response.status_code == 500
+        assert response.json() == {
+            "detail": "OpenAI API key is not configured on the server"
+        }
+
+    @patch("src.api.routes.integrity_report.get_async_openai_client")
+    @patch("src.api.routes.integrity_report.settings")
+    def test_stream_report_success(self, mock_settings, mock_get_client):
+        """Test that the report is streamed as plain text."""
+        mock_settings.openai_api_key = "test_key"
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=make_stream(["# Summary\n", None, "Low risk."])
+        )
+        mock_get_client.return_value = mock_client
+
+        response = client.post("/api/integrity/report/stream", json=request_data)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.text == "# Summary\nLow risk."
+        assert mock_client.chat.completions.create.call_args[1]["stream"] is True
+
+    @patch("src.api.routes.integrity_report.get_async_openai_client")
+    @patch("src.api.routes.integrity_report.settings")
+    def test_stream_report_failure_before_stream(self, mock_settings, mock_get_client):
+        """Test that a failure to start the stream is returned as a 500."""
+        mock_settings.openai_api_key = "test_key"
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=Exception("Rate limited")
+        )
+        mock_get_client.return_value = mock_client
+
+        response = client.post("/api/integrity/report/stream", json=request_data)
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "Failed to generate report: Rate limited"}
+
+    @patch("src.api.routes.integrity_report.get_async_openai_client")
+    @patch("src.api.routes.integrity_report.settings")
+    def test_stream_report_failure_mid_stream(self, mock_settings, mock_get_client):
+        """Test that a failure after the first chunk ends the body with an error marker."""
+        mock_settings.openai_api_key = "test_key"
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=make_stream(
+                ["# Summary\n"], error=Exception("Connection dropped")
+            )
+        )
+        mock_get_client.return_value = mock_client
+
+        response = client.post("/api/integrity/report/stream", json=request_data)
+
+        assert response.status_code == 200
+        assert response.text == (
+            f"# Summary\n\n\n{REPORT_STREAM_ERROR_MARKER} "
+            "Failed to generate report: Connection dropped\n"
+        )
@@ -7,9 +7,20 @@ from src.api.llm import (
     run_llm_with_instructor,
     stream_llm_with_instructor,
     stream_llm_with_openai,
+    get_async_openai_client,
+    get_openai_client,
+    get_instructor_client,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_llm_client_cache():
+    """Make sure that every test builds its clients from the patched classes."""
+    get_async_openai_client.cache_clear()
+    get_openai_client.cache_clear()
+    get_instructor_client.cache_clear()
+
+
 class TestIsReasoningModel:
     """Test the is_reasoning_model function."""
 
@@ -112,6 +123,38 @@ class TestValidateOpenaiApiKey:
         mock_client.models.list.assert_called_once()
 
 
+class TestLlmClients:
+    """Test the cached LLM client helpers."""
+
+    @patch("src.api.llm.instructor.from_openai")
+    @patch("src.api.llm.openai.AsyncOpenAI")
+    def test_clients_are_reused_for_the_same_api_key(
+        self, mock_async_openai, mock_instructor
+    ):
+        """Test that the clients are only created once per API key."""
+        mock_async_openai.side_effect = lambda api_key: MagicMock()
+        mock_instructor.side_effect = lambda client: MagicMock()
+
+        assert get_instructor_client("key_1") is get_instructor_client("key_1")
+        assert get_async_openai_client("key_1") is get_async_openai_client("key_1")
+        assert get_instructor_client("key_1") is not get_instructor_client("key_2")
+
+        assert mock_async_openai.call_count == 2
+        mock_async_openai.assert_any_call(api_key="key_1")
+        mock_async_openai.assert_any_call(api_key="key_2")
+        assert mock_instructor.call_count == 2
+
+    @patch("src.api.llm.openai.OpenAI")
+    def test_sync_client_is_reused_for_the_same_api_key(self, mock_openai):
+        """Test that the sync client is only created once per API key."""
+        mock_openai.side_effect = lambda api_key: MagicMock()
+
+        assert get_openai_client("key_1") is get_openai_client("key_1")
+        assert get_openai_client("key_1") is not get_openai_client("key_2")
+
+        assert mock_openai.call_count == 2
+
+
 @pytest.mark.asyncio
 class TestRunLlmWithInstructor:
     """Test the run_llm_with_instructor function."""
@@ -210,6 +210,10 @@ class TestGetTasksForCourse:
         assert "questions" in result["milestones"][0]["tasks"][1]
         assert result["milestones"][0]["tasks"][1]["questions"][0]["title"] == "question"
 
+        # the API key is only looked up once
+        mock_get_org_id.assert_called_once_with("valid_key")
+        mock_validate.assert_not_called()
+
     @patch("src.api.public.get_org_id_from_api_key")
     def test_get_tasks_for_course_invalid_api_key(self, mock_get_org_id):
         """Test course retrieval with invalid API key."""
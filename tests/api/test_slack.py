@@ -1,8 +1,10 @@
+import asyncio
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 import aiohttp
 from src.api.slack import (
     send_slack_notification,
+    send_slack_notifications,
     send_slack_notification_for_new_user,
     send_slack_notification_for_learner_added_to_cohort,
     send_slack_notification_for_member_added_to_org,
@@ -73,6 +75,49 @@ class TestSendSlackNotification:
         )
 
 
+@pytest.mark.asyncio
+class TestSendSlackNotifications:
+    """Test the best-effort send_slack_notifications function."""
+
+    async def test_send_slack_notifications_limits_concurrency(self):
+        """Test that only max_concurrency notifications are sent at once."""
+        in_flight = 0
+        max_in_flight = 0
+        sent = []
+
+        async def notification(index):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            sent.append(index)
+
+        await send_slack_notifications(
+            [notification(index) for index in range(10)], max_concurrency=3
+        )
+
+        assert sorted(sent) == list(range(10))
+        assert max_in_flight == 3
+
+    @patch("src.api.slack.logger")
+    async def test_send_slack_notifications_logs_failures(self, mock_logger):
+        """Test that a failed notification is logged and the rest are still sent."""
+        sent = []
+
+        async def notification(index):
+            if index == 1:
+                raise aiohttp.ClientError("Connection reset")
+            sent.append(index)
+
+        await send_slack_notifications([notification(index) for index in range(3)])
+
+        assert sent == [0, 2]
+        mock_logger.error.assert_called_once_with(
+            "Failed to send Slack notification: Connection reset"
+        )
+
+
 @pytest.mark.asyncio
 class TestSlackNotificationForNewUser:
     """Test send_slack_notification_for_new_user function."""
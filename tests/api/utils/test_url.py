@@ -67,3 +67,12 @@ class TestGetHomeUrl:
         params = {"param": "value"}
         result = get_home_url(params)
         assert result == "https://example.com/?param=value"
+
+    @patch.dict(os.environ, {"APP_URL": "https://example.com"})
+    def test_get_home_url_escapes_params(self):
+        """Test that get_home_url URL-encodes parameter values."""
+        params = {"email": "john+doe@example.com", "name": "John Doe"}
+        result = get_home_url(params)
+        assert (
+            result == "https://example.com?email=john%2Bdoe%40example.com&name=John+Doe"
+        )